@@ -7,6 +7,7 @@ Each tunnel has its own YAML config file.
 
 import os
 import yaml
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
@@ -147,7 +148,26 @@ class TunnelConfig:
         
         os.chmod(self._file_path, 0o600)
         self._auto_save = True  # Enable auto_save after manual save
-    
+
+    @contextmanager
+    def batch(self):
+        """Defer saving while many fields change; one write on exit.
+
+        Each property setter normally rewrites the YAML file, so a bulk
+        port add/remove pays one file write per port. Inside this context
+        mutations only touch the in-memory dict and a single save covers
+        the whole batch.
+        """
+        if not self._auto_save:
+            # Saving is already deferred (nested batch or manual-save mode)
+            yield self
+            return
+        self._auto_save = False
+        try:
+            yield self
+        finally:
+            self.save()
+
     def delete(self) -> bool:
         """Delete this tunnel's config file."""
         if self._file_path.exists():
@@ -317,9 +337,16 @@ class TunnelConfig:
         return self._config.copy()
 
 
+# Loaded tunnel configs keyed by name -> (st_mtime_ns, TunnelConfig).
+# An entry is reused while the backing file's mtime is unchanged, so the
+# repeated get_all_tunnels() calls within one menu tick skip the YAML
+# parse; any save bumps the mtime and invalidates naturally.
+_TUNNEL_CACHE: Dict[str, tuple] = {}
+
+
 class ConfigManager:
     """Manages multiple tunnel configurations."""
-    
+
     def __init__(self):
         self._ensure_dirs()
     
@@ -338,15 +365,26 @@ class ConfigManager:
         return sorted(tunnels)
     
     def get_tunnel(self, name: str) -> Optional[TunnelConfig]:
-        """Get a tunnel config by name."""
+        """Get a tunnel config by name (cached until the file changes)."""
         file_path = TUNNELS_DIR / f"{name}.yaml"
-        if file_path.exists():
-            return TunnelConfig(name)
-        return None
-    
+        try:
+            mtime_ns = file_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            _TUNNEL_CACHE.pop(name, None)
+            return None
+
+        cached = _TUNNEL_CACHE.get(name)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+
+        config = TunnelConfig(name)
+        _TUNNEL_CACHE[name] = (mtime_ns, config)
+        return config
+
     def get_all_tunnels(self) -> List[TunnelConfig]:
         """Get all tunnel configurations."""
-        return [TunnelConfig(name) for name in self.list_tunnels()]
+        tunnels = [self.get_tunnel(name) for name in self.list_tunnels()]
+        return [t for t in tunnels if t is not None]
     
     def create_tunnel(self, name: str) -> TunnelConfig:
         """Create a new tunnel config in memory (not saved until explicitly called)."""
@@ -7,6 +7,7 @@ Manages EasyTier mesh tunnel configuration and operations.
 import os
 import subprocess
 import logging
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, Tuple, Dict, Any, List
 import yaml
@@ -78,7 +79,19 @@ class EasyTierConfig:
             yaml.dump(self._config, f, default_flow_style=False)
         os.chmod(self._file_path, 0o600)
         self._auto_save = True
-    
+
+    @contextmanager
+    def batch(self):
+        """Defer saving while many fields change; one write on exit."""
+        if not self._auto_save:
+            yield self
+            return
+        self._auto_save = False
+        try:
+            yield self
+        finally:
+            self.save()
+
     def delete(self) -> bool:
         if self._file_path.exists():
             self._file_path.unlink()
@@ -254,9 +267,17 @@ WantedBy=multi-user.target
 """
         try:
             service_path = Path(f"/etc/systemd/system/{self._service_name}.service")
-            with open(service_path, 'w') as f:
-                f.write(service_content)
-            
+            new_content = service_content.encode()
+
+            # Skip the write and the expensive daemon-reload when the unit
+            # file on disk is already byte-identical (common on restart)
+            try:
+                if service_path.read_bytes() == new_content:
+                    return True, f"Service file unchanged: {self._service_name}"
+            except FileNotFoundError:
+                pass
+
+            service_path.write_bytes(new_content)
             self._run_command("systemctl daemon-reload")
             return True, f"Service file created: {self._service_name}"
         except Exception as e:
@@ -4,10 +4,14 @@ VortexL2 EasyTier UI Components
 UI functions for EasyTier tunnel management.
 """
 
+import re
+import string
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 from rich.prompt import Prompt, Confirm
 from rich import box
 
@@ -16,9 +20,24 @@ from .easytier_manager import EasyTierConfig, EasyTierManager, EasyTierConfigMan
 
 console = Console()
 
+# Compiled once: a latency value like "12.3ms". Strict on purpose — the
+# value comes from column-scraped CLI output, so a shifted column (an
+# IPv4 address, say) must not parse as a latency
+_LATENCY_RE = re.compile(r"(\d+(?:\.\d+)?)\s*ms?$")
 
-def show_easytier_main_menu() -> str:
-    """Display EasyTier main menu."""
+# Styled templates for the peer table, built once instead of per peer
+_GREEN_STAT = "[green]{}[/]"
+_YELLOW_STAT = "[yellow]{}[/]"
+_RED_STAT = "[red]{}[/]"
+
+# Tunnel-name sanitization table: everything outside [a-z0-9-] maps to '-'.
+# str.translate runs the whole pass in C instead of a per-character loop.
+_NAME_ALLOWED = set(string.ascii_lowercase + string.digits + "-")
+_NAME_TABLE = {i: "-" for i in range(128) if chr(i) not in _NAME_ALLOWED}
+
+
+def _build_main_menu_panel() -> Panel:
+    """Build the static main menu panel (done once at import)."""
     menu_items = [
         ("1", "TCP Optimization"),
         ("2", "Create EasyTier Tunnel"),
@@ -31,16 +50,32 @@ def show_easytier_main_menu() -> str:
         ("9", "DNS Manager"),
         ("0", "Exit"),
     ]
-    
+
     table = Table(show_header=False, box=box.SIMPLE, padding=(0, 2))
     table.add_column("Option", style="bold cyan", width=4)
     table.add_column("Description", style="white")
-    
+
     for opt, desc in menu_items:
         table.add_row(f"[{opt}]", desc)
-    
-    console.print(Panel(table, title="[bold white]EasyTier Menu[/]", border_style="green"))
-    
+
+    return Panel(table, title="[bold white]EasyTier Menu[/]", border_style="green")
+
+
+# The menu never changes, so construct it once instead of per display
+_MAIN_MENU_PANEL = _build_main_menu_panel()
+
+_ROLE_PROMPT = (
+    "\n[bold white]Select Server Role:[/]\n"
+    "  [bold cyan][1][/] [green]IRAN[/]\n"
+    "  [bold cyan][2][/] [magenta]KHAREJ[/]\n"
+    "  [bold cyan][0][/] Cancel"
+)
+
+
+def show_easytier_main_menu() -> str:
+    """Display EasyTier main menu."""
+    console.print(_MAIN_MENU_PANEL)
+
     return Prompt.ask("\n[bold cyan]Select option[/]", default="0")
 
 
@@ -62,11 +97,25 @@ def show_easytier_tunnel_list(manager: EasyTierConfigManager):
     table.add_column("Port", style="white")
     table.add_column("Status", style="white")
     
+    # One manager and one status probe per tunnel, keyed by name so both
+    # render loops share them; the subprocess-bound status/peer queries are
+    # overlapped instead of probing tunnels one at a time
+    mgrs = {config.name: EasyTierManager(config) for config in tunnels}
+    with ThreadPoolExecutor(max_workers=min(8, len(mgrs))) as executor:
+        statuses = dict(zip(
+            mgrs,
+            executor.map(lambda m: m.get_status(), mgrs.values())
+        ))
+        running_mgrs = [m for name, m in mgrs.items() if statuses[name][0]]
+        peer_infos = dict(zip(
+            (m.config.name for m in running_mgrs),
+            executor.map(lambda m: m.get_peer_info(), running_mgrs)
+        ))
+
     for i, config in enumerate(tunnels, 1):
-        mgr = EasyTierManager(config)
-        is_running, status = mgr.get_status()
+        is_running, status = statuses[config.name]
         status_display = f"[green]{status}[/]" if is_running else f"[red]{status}[/]"
-        
+
         table.add_row(
             str(i),
             config.name,
@@ -77,71 +126,64 @@ def show_easytier_tunnel_list(manager: EasyTierConfigManager):
             status_display
         )
     
-    console.print(table)
-    
-    # Get peer info for running tunnels
+    # Accumulate renderables and emit everything with a single print,
+    # so rich parses markup and flushes ANSI output once per render
+    renderables = [table]
+
+    # Peer info for running tunnels (already fetched concurrently above)
     for config in tunnels:
-        mgr = EasyTierManager(config)
-        is_running, _ = mgr.get_status()
-        
-        if is_running:
-            peers = mgr.get_peer_info()
-            if peers:
-                console.print(f"\n[bold cyan]Peer Stats for {config.name}:[/]")
-                
-                peer_table = Table(box=box.SIMPLE)
-                peer_table.add_column("IP", style="green")
-                peer_table.add_column("Host", style="magenta")
-                peer_table.add_column("Type", style="yellow")
-                peer_table.add_column("Latency", style="cyan")
-                peer_table.add_column("Loss", style="red")
-                peer_table.add_column("RX", style="blue")
-                peer_table.add_column("TX", style="blue")
-                peer_table.add_column("Tunnel", style="white")
-                
-                for peer in peers:
-                    # Color latency based on value
-                    lat = peer.get('latency', '-') or '-'
-                    if lat != '-':
-                        try:
-                            lat_val = float(lat.replace('ms', '').strip())
-                            if lat_val < 50:
-                                lat = f"[green]{lat}[/]"
-                            elif lat_val < 100:
-                                lat = f"[yellow]{lat}[/]"
-                            else:
-                                lat = f"[red]{lat}[/]"
-                        except:
-                            pass
-                    
-                    # Color loss
-                    loss = peer.get('loss', '-') or '-'
-                    if loss != '-' and loss != '0.0%':
-                        loss = f"[red]{loss}[/]"
-                    elif loss == '0.0%':
-                        loss = f"[green]{loss}[/]"
-                    
-                    peer_table.add_row(
-                        peer.get('ipv4', '-'),
-                        peer.get('hostname', '-'),
-                        peer.get('cost', '-'),
-                        lat,
-                        loss,
-                        peer.get('rx', '-') or '-',
-                        peer.get('tx', '-') or '-',
-                        peer.get('tunnel', '-') or '-'
-                    )
+        peers = peer_infos.get(config.name)
+        if peers:
+            renderables.append(Text(f"\nPeer Stats for {config.name}:", style="bold cyan"))
+
+            peer_table = Table(box=box.SIMPLE)
+            peer_table.add_column("IP", style="green")
+            peer_table.add_column("Host", style="magenta")
+            peer_table.add_column("Type", style="yellow")
+            peer_table.add_column("Latency", style="cyan")
+            peer_table.add_column("Loss", style="red")
+            peer_table.add_column("RX", style="blue")
+            peer_table.add_column("TX", style="blue")
+            peer_table.add_column("Tunnel", style="white")
+            
+            for peer in peers:
+                # Color latency based on value
+                lat = peer.get('latency', '-') or '-'
+                match = _LATENCY_RE.match(lat)
+                if match:
+                    lat_val = float(match.group(1))
+                    if lat_val < 50:
+                        lat = _GREEN_STAT.format(lat)
+                    elif lat_val < 100:
+                        lat = _YELLOW_STAT.format(lat)
+                    else:
+                        lat = _RED_STAT.format(lat)
+
+                # Color loss
+                loss = peer.get('loss', '-') or '-'
+                if loss != '-':
+                    loss = (_GREEN_STAT if loss == '0.0%' else _RED_STAT).format(loss)
                 
-                console.print(peer_table)
+                peer_table.add_row(
+                    peer.get('ipv4', '-'),
+                    peer.get('hostname', '-'),
+                    peer.get('cost', '-'),
+                    lat,
+                    loss,
+                    peer.get('rx', '-') or '-',
+                    peer.get('tx', '-') or '-',
+                    peer.get('tunnel', '-') or '-'
+                )
+
+            renderables.append(peer_table)
+
+    console.print(Group(*renderables))
 
 
 def prompt_easytier_side() -> Optional[str]:
     """Prompt for EasyTier tunnel side."""
-    console.print("\n[bold white]Select Server Role:[/]")
-    console.print("  [bold cyan][1][/] [green]IRAN[/]")
-    console.print("  [bold cyan][2][/] [magenta]KHAREJ[/]")
-    console.print("  [bold cyan][0][/] Cancel")
-    
+    console.print(_ROLE_PROMPT)
+
     choice = Prompt.ask("\n[bold cyan]Select role[/]", default="1")
     
     if choice == "1":
@@ -251,5 +293,8 @@ def prompt_tunnel_name() -> Optional[str]:
     name = Prompt.ask("[bold magenta]Tunnel Name[/]", default="tunnel1")
     
     # Sanitize
-    name = "".join(c if c.isalnum() or c == "-" else "-" for c in name.lower())
+    name = name.lower()
+    if not name.isascii():
+        name = name.encode("ascii", "replace").decode()
+    name = name.translate(_NAME_TABLE)
     return name if name else None
@@ -1,5 +1,6 @@
 import subprocess
 import logging
+from contextlib import nullcontext
 from pathlib import Path
 from typing import List, Tuple, Dict, Optional
 
@@ -15,6 +16,38 @@ HAPROXY_CONFIG_FILE = HAPROXY_CONFIG_DIR / "haproxy.cfg"
 HAPROXY_BACKUP_FILE = HAPROXY_CONFIG_DIR / "haproxy.cfg.bak"
 
 
+def parse_ports(ports_str: str) -> Tuple[List[int], List[str]]:
+    """Parse a comma-separated port list (supports ranges like 443-450).
+
+    Entries are validated with str.isdigit before conversion, so
+    well-formed input never pays for exception handling. Returns
+    (valid_ports, error_messages).
+    """
+    valid: List[int] = []
+    errors: List[str] = []
+
+    for part in ports_str.split(','):
+        part = part.strip()
+        if not part:
+            continue
+
+        if '-' in part:
+            start_str, _, end_str = part.partition('-')
+            start_str, end_str = start_str.strip(), end_str.strip()
+            if start_str.isdigit() and end_str.isdigit():
+                start, end = int(start_str), int(end_str)
+                if 1 <= start <= end <= 65535:
+                    valid.extend(range(start, end + 1))
+                    continue
+            errors.append(f"Invalid port range: {part}")
+        elif part.isdigit() and 1 <= int(part) <= 65535:
+            valid.append(int(part))
+        else:
+            errors.append(f"Invalid port: {part}")
+
+    return valid, errors
+
+
 class HAProxyManager:
     """Manages HAProxy for port forwarding."""
     
@@ -200,34 +233,48 @@ backend backend_{port}
     
     def add_multiple_forwards(self, ports_str: str) -> Tuple[bool, str]:
         """Add multiple port forwards from comma-separated string or range."""
-        results = []
-        ports = []
-        
-        # Parse ports (supports: 443, 8443 or 443-450 range)
-        try:
-            for part in ports_str.split(','):
-                part = part.strip()
-                if '-' in part:
-                    start, end = map(int, part.split('-'))
-                    ports.extend(range(start, end + 1))
-                else:
-                    ports.append(int(part))
-        except ValueError:
+        # Validate the whole input up front (supports: 443, 8443 or 443-450)
+        ports, parse_errors = parse_ports(ports_str)
+        if not ports:
             return False, "Invalid port format"
-        
+
+        results = [f"✗ {err}" for err in parse_errors]
+
         active_ports = []
         inactive_ports = []
-        
-        for port in ports:
-            success, msg = self.create_forward(port)
-            
-            if success:
+
+        # Validate every port first, then apply one config write + reload
+        # for the whole batch instead of one HAProxy restart per port;
+        # config.batch() likewise collapses the YAML saves into one
+        ctx = self.config.batch() if self.config else nullcontext()
+        with ctx:
+            for port in ports:
+                if not self.config:
+                    inactive_ports.append(port)
+                    results.append(f"✗ Port {port}: No tunnel configuration provided")
+                    continue
+                if port in self.config.forwarded_ports:
+                    inactive_ports.append(port)
+                    results.append(f"✗ Port {port}: Port {port} already in forwarded list")
+                    continue
+                if self._is_port_listening(port):
+                    process_info = self._get_port_process(port)
+                    detail = f"by: {process_info}" if process_info else "by another process"
+                    inactive_ports.append(port)
+                    results.append(f"✗ Port {port}: Port {port} is already in use {detail}")
+                    continue
+
+                self.config.add_port(port)
                 active_ports.append(port)
                 results.append(f"✓ Port {port}: ACTIVE")
-            else:
-                inactive_ports.append(port)
-                results.append(f"✗ Port {port}: {msg}")
-        
+
+        if active_ports:
+            config = self._generate_haproxy_config()
+            if not self._write_config_file(config):
+                return False, "Failed to write HAProxy configuration"
+            if not self._reload_haproxy():
+                return False, "Failed to reload HAProxy"
+
         # Summary at the end
         if active_ports and inactive_ports:
             summary = f"\nSummary: {len(active_ports)} activated, {len(inactive_ports)} failed"
@@ -241,25 +288,35 @@ backend backend_{port}
     
     def remove_multiple_forwards(self, ports_str: str) -> Tuple[bool, str]:
         """Remove multiple port forwards from comma-separated string or range."""
-        results = []
-        ports = []
-        
-        # Parse ports (supports: 443, 8443 or 443-450 range)
-        try:
-            for part in ports_str.split(','):
-                part = part.strip()
-                if '-' in part:
-                    start, end = map(int, part.split('-'))
-                    ports.extend(range(start, end + 1))
-                else:
-                    ports.append(int(part))
-        except ValueError:
+        # Validate the whole input up front (supports: 443, 8443 or 443-450)
+        ports, parse_errors = parse_ports(ports_str)
+        if not ports:
             return False, "Invalid port format"
-        
-        for port in ports:
-            success, msg = self.remove_forward(port)
-            results.append(f"Port {port}: {msg}")
-        
+
+        results = [f"✗ {err}" for err in parse_errors]
+
+        removed = []
+        ctx = self.config.batch() if self.config else nullcontext()
+        with ctx:
+            for port in ports:
+                if not self.config:
+                    results.append(f"Port {port}: No tunnel configuration provided")
+                    continue
+                if port not in self.config.forwarded_ports:
+                    results.append(f"Port {port}: Port {port} is not in forwarded list")
+                    continue
+                self.config.remove_port(port)
+                removed.append(port)
+                results.append(f"Port {port}: Port forward for {port} removed")
+
+        # One config write + reload covers the whole batch
+        if removed:
+            current_config = self._generate_haproxy_config()
+            if not self._write_config_file(current_config):
+                return False, "Failed to update HAProxy configuration"
+            if not self._reload_haproxy():
+                return False, "Failed to reload HAProxy"
+
         return True, "\n".join(results)
     
     def list_forwards(self) -> List[Dict]:
@@ -7,32 +7,57 @@ Main entry point and CLI handler.
 
 import sys
 import os
+import json
+import fnmatch
 import argparse
 import subprocess
 import signal
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# CRITICAL: Fix sys.path BEFORE any vortexl2 imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# CRITICAL: Fix sys.path BEFORE any vortexl2 imports — but only when run as
+# a script; importing vortexl2 as a library should not mutate sys.path
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from vortexl2.haproxy_manager import HAProxyManager
 from vortexl2 import __version__
 from vortexl2.config import TunnelConfig, ConfigManager, GlobalConfig
 from vortexl2.tunnel import TunnelManager
 from vortexl2.forward import get_forward_manager, get_forward_mode, set_forward_mode, ForwardManager
-from vortexl2 import ui
+ui = None  # set by _load_ui(); the non-interactive 'apply' path never needs it
+
+
+def _load_ui():
+    """Import the rich-based UI module on first interactive use.
+
+    'vortexl2 apply' runs from systemd on every boot and only prints
+    plain text, so deferring this import keeps rich (and pygments) out
+    of its cold start entirely.
+    """
+    global ui
+    if ui is None:
+        from vortexl2 import ui as _ui
+        ui = _ui
 
 
 def signal_handler(sig, frame):
     """Handle Ctrl+C gracefully."""
     print("\n")
-    ui.console.print("[yellow]Interrupted. Goodbye![/]")
+    if ui is not None:
+        ui.console.print("[yellow]Interrupted. Goodbye![/]")
+    else:
+        print("Interrupted. Goodbye!")
     sys.exit(0)
 
 
 def check_root():
     """Check if running as root."""
     if os.geteuid() != 0:
-        ui.show_error("VortexL2 must be run as root (use sudo)")
+        if ui is not None:
+            ui.show_error("VortexL2 must be run as root (use sudo)")
+        else:
+            print("Error: VortexL2 must be run as root (use sudo)", file=sys.stderr)
         sys.exit(1)
 
 
@@ -47,9 +72,9 @@ def restart_forward_daemon():
     mode = get_forward_mode()
     
     if mode == "haproxy":
-        subprocess.run("systemctl start haproxy", shell=True, capture_output=True)
+        subprocess.run(["systemctl", "start", "haproxy"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     
-    subprocess.run("systemctl restart vortexl2-forward-daemon", shell=True, capture_output=True)
+    subprocess.run(["systemctl", "restart", "vortexl2-forward-daemon"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
 
 # ============================================
@@ -66,28 +91,43 @@ def cmd_apply():
     # L2TPv3 mode
     manager = ConfigManager()
     tunnels = manager.get_all_tunnels()
-    
+
     if not tunnels:
         print("VortexL2: No tunnels configured, skipping")
         return 0
-    
-    errors = 0
+
     for config in tunnels:
         if not config.is_configured():
             print(f"VortexL2: Tunnel '{config.name}' not fully configured, skipping")
-            continue
-        
-        tunnel = TunnelManager(config)
-        success, msg = tunnel.full_setup()
-        print(f"Tunnel '{config.name}': {msg}")
-        
-        if not success:
-            errors += 1
-    
+
+    configured = [c for c in tunnels if c.is_configured()]
+
+    # Each setup blocks on several ip/systemctl subprocesses, so run the
+    # tunnels in parallel; boot time stays near one setup instead of the sum
+    errors = 0
+    if configured:
+        with ThreadPoolExecutor(max_workers=min(8, len(configured))) as executor:
+            futures = {
+                executor.submit(_apply_one_tunnel, config): config
+                for config in configured
+            }
+            for future in as_completed(futures):
+                name, success, msg = future.result()
+                print(f"Tunnel '{name}': {msg}")
+                if not success:
+                    errors += 1
+
     print("VortexL2: Tunnel setup complete.")
     return 1 if errors > 0 else 0
 
 
+def _apply_one_tunnel(config):
+    """Set up a single L2TPv3 tunnel; returns (name, success, message)."""
+    tunnel = TunnelManager(config)
+    success, msg = tunnel.full_setup()
+    return config.name, success, msg
+
+
 def cmd_apply_easytier():
     """Apply all EasyTier tunnel configurations."""
     from vortexl2.easytier_manager import EasyTierConfigManager, EasyTierManager
@@ -99,19 +139,26 @@ def cmd_apply_easytier():
         print("VortexL2: No EasyTier tunnels configured, skipping")
         return 0
     
-    errors = 0
     for config in tunnels:
         if not config.is_configured():
             print(f"VortexL2: EasyTier tunnel '{config.name}' not fully configured, skipping")
-            continue
-        
-        tunnel_mgr = EasyTierManager(config)
-        success, msg = tunnel_mgr.start_tunnel()
-        print(f"EasyTier tunnel '{config.name}': {msg}")
-        
-        if not success:
-            errors += 1
-    
+
+    configured = [c for c in tunnels if c.is_configured()]
+
+    def _start_one(config):
+        success, msg = EasyTierManager(config).start_tunnel()
+        return config.name, success, msg
+
+    errors = 0
+    if configured:
+        with ThreadPoolExecutor(max_workers=min(8, len(configured))) as executor:
+            futures = {executor.submit(_start_one, c): c for c in configured}
+            for future in as_completed(futures):
+                name, success, msg = future.result()
+                print(f"EasyTier tunnel '{name}': {msg}")
+                if not success:
+                    errors += 1
+
     print("VortexL2: EasyTier tunnel setup complete.")
     return 1 if errors > 0 else 0
 
@@ -314,7 +361,7 @@ def handle_forwards_menu(manager: ConfigManager):
             
             if new_mode and new_mode != current_mode:
                 if current_mode == "haproxy":
-                    subprocess.run("systemctl stop haproxy", shell=True, capture_output=True)
+                    subprocess.run(["systemctl", "stop", "haproxy"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 elif current_mode == "socat":
                     from vortexl2.socat_manager import stop_all_socat
                     stop_all_socat()
@@ -326,7 +373,7 @@ def handle_forwards_menu(manager: ConfigManager):
                     if ui.Confirm.ask("Start port forwarding now?", default=True):
                         restart_forward_daemon()
                 else:
-                    subprocess.run("systemctl stop haproxy", shell=True, capture_output=True)
+                    subprocess.run(["systemctl", "stop", "haproxy"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             ui.wait_for_enter()
         elif choice == "7":
             from vortexl2.cron_manager import (
@@ -363,14 +410,50 @@ def handle_logs(manager: ConfigManager):
     else:
         services = ["vortexl2-tunnel.service", "vortexl2-forward-daemon.service"]
     
+    # One journalctl invocation covers every unit; JSON output carries the
+    # unit name so the interleaved lines can be regrouped per service.
+    # The line budget is generous so one chatty unit cannot evict the
+    # other services' entries from the shared tail
+    args = ["journalctl", "--no-pager", "--output=json", "-n", str(100 * len(services))]
     for service in services:
-        result = subprocess.run(
-            f"journalctl -u {service} -n 20 --no-pager",
-            shell=True, capture_output=True, text=True
-        )
-        output = result.stdout or result.stderr or "No logs available"
-        ui.show_output(output, f"Logs: {service}")
-    
+        args += ["-u", service]
+    result = subprocess.run(args, capture_output=True, text=True)
+
+    by_unit = {}
+    for line in result.stdout.splitlines():
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+        # Prefer UNIT: messages PID 1 logs about a service ("Started ...")
+        # carry _SYSTEMD_UNIT=init.scope and name the service in UNIT
+        unit = entry.get("UNIT") or entry.get("_SYSTEMD_UNIT") or "unknown"
+        message = entry.get("MESSAGE", "")
+        if isinstance(message, list):
+            # journald encodes non-UTF8 payloads as byte arrays
+            message = bytes(message).decode("utf-8", "replace")
+        timestamp = entry.get("__REALTIME_TIMESTAMP")
+        if timestamp:
+            stamp = datetime.fromtimestamp(int(timestamp) / 1e6).strftime("%b %d %H:%M:%S")
+            message = f"{stamp} {message}"
+        by_unit.setdefault(unit, []).append(message)
+
+    # One panel per requested service, even when it produced no entries
+    rendered = set()
+    for service in services:
+        matched = [u for u in by_unit if fnmatch.fnmatch(u, service)]
+        if not matched:
+            ui.show_output(result.stderr or "No logs available", f"Logs: {service}")
+            continue
+        for unit in matched:
+            rendered.add(unit)
+            ui.show_output("\n".join(by_unit[unit][-20:]), f"Logs: {unit}")
+
+    # Entries attributed outside the requested units still get shown
+    for unit, lines in by_unit.items():
+        if unit not in rendered:
+            ui.show_output("\n".join(lines[-20:]), f"Logs: {unit}")
+
     ui.wait_for_enter()
 
 
@@ -539,9 +622,12 @@ def handle_easytier_forwards_menu():
         
         def add_port(self, port):
             self._et_config.add_port(port)
-        
+
         def remove_port(self, port):
             self._et_config.remove_port(port)
+
+        def batch(self):
+            return self._et_config.batch()
     
     wrapper = EasyTierConfigWrapper(config)
     
@@ -735,8 +821,7 @@ def handle_dns_menu():
 
 def main_menu():
     """Main interactive menu loop."""
-    check_root()
-    signal.signal(signal.SIGINT, signal_handler)
+    # Root check and SIGINT handler are installed once in main()
     ui.clear_screen()
     
     tunnel_mode = get_tunnel_mode()
@@ -854,11 +939,12 @@ Examples:
     )
     
     args = parser.parse_args()
-    
+
+    check_root()
     if args.command == 'apply':
-        check_root()
         sys.exit(cmd_apply())
     else:
+        _load_ui()
         main_menu()
 
 
@@ -8,22 +8,81 @@ Compatible with HAProxyManager interface.
 
 import subprocess
 import re
+import shlex
+import shutil
+import string
 import asyncio
-from typing import List, Dict, Tuple, Optional
+from pathlib import Path
+from typing import List, Dict, Tuple, Optional, Union
 from vortexl2.config import ConfigManager
+from vortexl2.haproxy_manager import parse_ports
 
+# Optional: pystemd answers unit-state queries over one persistent DBus
+# connection instead of forking systemctl per poll. Falls back to the
+# subprocess path when it isn't installed.
+try:
+    from pystemd.systemd1 import Unit as _SystemdUnit
+    _HAS_PYSTEMD = True
+except ImportError:
+    _HAS_PYSTEMD = False
 
-def run_command(cmd: str) -> Tuple[bool, str, str]:
-    """Execute a shell command and return success, stdout, stderr."""
+# Commands containing these need a real shell (pipes, redirections, etc.)
+_SHELL_META_RE = re.compile(r"[|&;<>$`]")
+
+# Unit file template, compiled once at import instead of re-parsing an
+# f-string on every service file write
+SOCAT_SERVICE_TEMPLATE = string.Template("""[Unit]
+Description=VortexL2 Socat Port Forward $local_port
+After=network.target
+Wants=vortexl2-tunnel.service
+
+[Service]
+Type=simple
+ExecStart=$socat_cmd
+Restart=on-failure
+RestartSec=5
+StartLimitIntervalSec=60
+StartLimitBurst=5
+StandardOutput=journal
+StandardError=journal
+
+[Install]
+WantedBy=multi-user.target
+""")
+
+
+def run_command(cmd: Union[str, List[str]], capture: bool = True) -> Tuple[bool, str, str]:
+    """Execute a command and return success, stdout, stderr.
+
+    Plain commands (argv lists or simple strings like 'systemctl stop foo')
+    run without a shell, skipping the extra /bin/sh fork. Strings that use
+    shell syntax (pipes, redirections) still go through the shell.
+
+    Callers that only care about the exit status can pass capture=False to
+    send output to /dev/null instead of allocating and draining pipes.
+    """
     try:
+        if isinstance(cmd, str):
+            if _SHELL_META_RE.search(cmd):
+                args, use_shell = cmd, True
+            else:
+                args, use_shell = shlex.split(cmd), False
+        else:
+            args, use_shell = cmd, False
+
+        output = subprocess.PIPE if capture else subprocess.DEVNULL
         result = subprocess.run(
-            cmd,
-            shell=True,
-            capture_output=True,
-            text=True,
+            args,
+            shell=use_shell,
+            stdout=output,
+            stderr=output,
             timeout=10
         )
-        return result.returncode == 0, result.stdout, result.stderr
+        # Capture bytes and decode once; the machine-parsed tool output is
+        # ASCII, so this skips text-mode newline translation per call
+        stdout = result.stdout.decode("ascii", "ignore") if result.stdout else ""
+        stderr = result.stderr.decode("ascii", "ignore") if result.stderr else ""
+        return result.returncode == 0, stdout, stderr
     except subprocess.TimeoutExpired:
         return False, "", "Command timed out"
     except Exception as e:
@@ -41,16 +100,22 @@ class SocatManager:
             config: Tunnel configuration object (optional)
         """
         self.config = config
-    
+        self._socat_installed = False
+
     def check_socat_installed(self) -> bool:
         """Check if socat is installed."""
-        success, _, _ = run_command("which socat")
-        return success
+        # Cache a positive result so bulk create_forward loops only pay for
+        # the PATH scan once; a missing binary is re-checked each time so a
+        # mid-session install is picked up
+        if not self._socat_installed:
+            # shutil.which does the same PATH lookup without forking a shell
+            self._socat_installed = shutil.which("socat") is not None
+        return self._socat_installed
         
     def _is_port_listening(self, port: int) -> bool:
         """Check if a port is listening (helper)."""
         cmd = f"netstat -tlnp 2>/dev/null | grep -E ':{port}\\b'"
-        success, _, _ = run_command(cmd)
+        success, _, _ = run_command(cmd, capture=False)
         return success
 
     def _get_port_process(self, port: int) -> Optional[str]:
@@ -66,16 +131,97 @@ class SocatManager:
             return f"{proc_name} (PID: {pid})"
         return None
 
+    def _systemctl(self, *args: str) -> Tuple[bool, str]:
+        """Run systemctl with the given arguments directly via argv.
+
+        Avoids both the shell fork and per-call command-string parsing.
+        Returns (success, output) where output is stdout or stderr.
+        """
+        try:
+            result = subprocess.run(
+                ["systemctl", *args],
+                capture_output=True,
+                text=True,
+                timeout=30,
+                check=False
+            )
+            return result.returncode == 0, (result.stdout.strip() or result.stderr.strip())
+        except subprocess.TimeoutExpired:
+            return False, "Command timed out"
+        except Exception as e:
+            return False, str(e)
+
     def _get_service_name(self, port: int) -> str:
         """Get systemd service name for a port."""
         return f"vortexl2-socat-{port}"
+
+    def _bulk_unit_state_dbus(self, ports: List[int]) -> Dict[int, Dict[str, str]]:
+        """Query unit states over DBus via pystemd (no systemctl forks)."""
+        states: Dict[int, Dict[str, str]] = {}
+        for port in ports:
+            unit_name = f"{self._get_service_name(port)}.service".encode()
+            with _SystemdUnit(unit_name, _autoload=True) as unit:
+                states[port] = {
+                    "ActiveState": unit.Unit.ActiveState.decode(),
+                    "UnitFileState": (unit.Unit.UnitFileState or b"").decode(),
+                }
+        return states
+
+    def _bulk_unit_state(self, ports: List[int]) -> Dict[int, Dict[str, str]]:
+        """
+        Query systemd unit state for many ports without forking per port.
+
+        Returns a dict keyed by port with 'ActiveState' and 'UnitFileState'
+        entries. With pystemd installed the states come straight off the
+        systemd DBus API; otherwise one `systemctl show` covers every unit.
+        """
+        if not ports:
+            return {}
+
+        if _HAS_PYSTEMD:
+            try:
+                return self._bulk_unit_state_dbus(ports)
+            except Exception:
+                pass  # e.g. DBus unavailable in a container; use systemctl
+
+        port_by_unit = {f"{self._get_service_name(p)}.service": p for p in ports}
+        try:
+            result = subprocess.run(
+                ["systemctl", "show", "--property=Id,ActiveState,UnitFileState", "--all", "--"]
+                + list(port_by_unit),
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+        except Exception:
+            return {}
+
+        # systemctl prints one blank-line-separated block per unit; key the
+        # blocks by their reported Id rather than trusting argument order
+        states: Dict[int, Dict[str, str]] = {}
+        for block in result.stdout.split("\n\n"):
+            if not block.strip():
+                continue
+            props = {}
+            for line in block.splitlines():
+                key, _, value = line.partition("=")
+                props[key] = value
+            port = port_by_unit.get(props.get("Id", ""))
+            if port is not None:
+                states[port] = props
+        return states
     
     def _get_service_path(self, port: int) -> str:
         """Get systemd service file path."""
         return f"/etc/systemd/system/{self._get_service_name(port)}.service"
     
-    def _create_service_file(self, local_port: int, remote_ip: str, remote_port: int) -> Tuple[bool, str]:
-        """Create systemd service file for socat port forward with keepalive and auto-recovery."""
+    def _create_service_file(self, local_port: int, remote_ip: str, remote_port: int) -> Tuple[bool, bool, str]:
+        """Create systemd service file for socat port forward with keepalive and auto-recovery.
+
+        Returns (success, changed, message); changed is False when the file
+        on disk already had identical content, so callers can skip the
+        daemon-reload for no-op updates.
+        """
         service_name = self._get_service_name(local_port)
         # Enhanced socat command with keepalive and TCP optimizations for stability
         socat_cmd = (
@@ -83,30 +229,23 @@ class SocatManager:
             f"TCP-LISTEN:{local_port},fork,reuseaddr,keepalive,tcp-keepidle=60,tcp-keepintvl=10,tcp-keepcnt=3 "
             f"TCP:{remote_ip}:{remote_port},keepalive,tcp-keepidle=60,tcp-keepintvl=10,tcp-keepcnt=3"
         )
-        service_content = f"""[Unit]
-Description=VortexL2 Socat Port Forward {local_port}
-After=network.target
-Wants=vortexl2-tunnel.service
-
-[Service]
-Type=simple
-ExecStart={socat_cmd}
-Restart=on-failure
-RestartSec=5
-StartLimitIntervalSec=60
-StartLimitBurst=5
-StandardOutput=journal
-StandardError=journal
-
-[Install]
-WantedBy=multi-user.target
-"""
+        service_content = SOCAT_SERVICE_TEMPLATE.substitute(
+            local_port=local_port,
+            socat_cmd=socat_cmd
+        )
         try:
-            with open(self._get_service_path(local_port), 'w') as f:
-                f.write(service_content)
-            return True, f"Service file created: {service_name}"
+            service_path = Path(self._get_service_path(local_port))
+            new_content = service_content.encode()
+            try:
+                if service_path.read_bytes() == new_content:
+                    return True, False, f"Service file unchanged: {service_name}"
+            except FileNotFoundError:
+                pass
+            # Single unbuffered write instead of the buffered open/write/close
+            service_path.write_bytes(new_content)
+            return True, True, f"Service file created: {service_name}"
         except Exception as e:
-            return False, f"Failed to create service file: {e}"
+            return False, False, f"Failed to create service file: {e}"
     
     def _remove_service_file(self, port: int) -> None:
         """Remove systemd service file."""
@@ -130,19 +269,20 @@ WantedBy=multi-user.target
         service_name = self._get_service_name(local_port)
         
         # Create service file
-        success, msg = self._create_service_file(local_port, remote_ip, remote_port)
+        success, changed, msg = self._create_service_file(local_port, remote_ip, remote_port)
         if not success:
             return False, msg
-        
-        # Reload systemd and start service
-        run_command("systemctl daemon-reload")
-        run_command(f"systemctl enable {service_name}")
-        success, stdout, stderr = run_command(f"systemctl start {service_name}")
+
+        # Reload systemd (only when the unit file actually changed) and start
+        if changed:
+            self._systemctl("daemon-reload")
+        self._systemctl("enable", service_name)
+        success, output = self._systemctl("start", service_name)
         
         if not success:
             self._remove_service_file(local_port)
-            run_command("systemctl daemon-reload")
-            return False, f"Failed to start service: {stderr}"
+            self._systemctl("daemon-reload")
+            return False, f"Failed to start service: {output}"
         
         # Wait longer for socat to start listening
         for _ in range(6):  # Try for 3 seconds
@@ -151,16 +291,16 @@ WantedBy=multi-user.target
                 return True, f"Socat forward started: {local_port} → {remote_ip}:{remote_port}"
         
         # Check if service is still running even if port check failed
-        _, status_out, _ = run_command(f"systemctl is-active {service_name}")
-        if status_out and "active" in status_out.strip():
+        _, status_out = self._systemctl("is-active", service_name)
+        if status_out and "active" in status_out:
             # Service is running, consider it success
             return True, f"Socat forward started: {local_port} → {remote_ip}:{remote_port}"
         
         # Service failed, clean up
-        run_command(f"systemctl stop {service_name}")
-        run_command(f"systemctl disable {service_name}")
+        self._systemctl("stop", service_name)
+        self._systemctl("disable", service_name)
         self._remove_service_file(local_port)
-        run_command("systemctl daemon-reload")
+        self._systemctl("daemon-reload")
         return False, f"Socat service started but port not listening. Status: {status_out[:200] if status_out else 'unknown'}"
     
     def stop_forward(self, local_port: int) -> Tuple[bool, str]:
@@ -172,12 +312,12 @@ WantedBy=multi-user.target
         service_path = self._get_service_path(local_port)
         
         # Stop and disable service
-        run_command(f"systemctl stop {service_name}")
-        run_command(f"systemctl disable {service_name}")
+        self._systemctl("stop", service_name)
+        self._systemctl("disable", service_name)
         
         # Remove service file
         self._remove_service_file(local_port)
-        run_command("systemctl daemon-reload")
+        self._systemctl("daemon-reload")
         
         # Verify it stopped
         time.sleep(0.3)
@@ -186,7 +326,7 @@ WantedBy=multi-user.target
         else:
             # Fallback: kill directly
             cmd = f"pkill -f 'socat.*TCP-LISTEN:{local_port}[^0-9]'"
-            run_command(cmd)
+            run_command(cmd, capture=False)
             time.sleep(0.3)
             if not self._is_port_listening(local_port):
                 return True, f"Stopped socat forward on port {local_port} (forced)"
@@ -232,73 +372,153 @@ WantedBy=multi-user.target
         self.config.remove_port(port)
         return True, f"Port forward {port} removed"
 
-    def add_multiple_forwards(self, ports_str: str) -> Tuple[bool, str]:
-        """Add multiple forwards."""
-        ports = []
-        try:
-            for part in ports_str.split(','):
-                part = part.strip()
-                if '-' in part:
-                    start, end = map(int, part.split('-'))
-                    ports.extend(range(start, end + 1))
-                else:
-                    ports.append(int(part))
-        except ValueError:
-            return False, "Invalid port format"
-            
+    def create_forwards(self, ports: List[int]) -> Tuple[bool, str]:
+        """Create forwards for many ports with batched systemctl calls.
+
+        Service files are written per port, then a single daemon-reload and
+        a single 'systemctl enable --now' cover every new unit, instead of
+        one reload + enable + start per port.
+        """
+        if not self.config:
+            return False, "No tunnel configuration provided"
+
+        remote_ip = self.config.remote_forward_ip
+        if not remote_ip:
+            return False, "Remote forward IP not configured for this tunnel"
+
+        if not self.check_socat_installed():
+            return False, "socat is not installed. Install with: apt-get install socat"
+
         results = []
+        pending = []
+        any_changed = False
         for port in ports:
-            success, msg = self.create_forward(port)
-            results.append(msg)
-            
+            if port in self.config.forwarded_ports:
+                results.append(f"Port {port}: already in forwarded list")
+                continue
+            if self._is_port_listening(port):
+                proc = self._get_port_process(port)
+                results.append(f"Port {port}: already in use by {proc or 'unknown process'}")
+                continue
+
+            success, changed, msg = self._create_service_file(port, remote_ip, port)
+            if not success:
+                results.append(f"Port {port}: {msg}")
+                continue
+            pending.append(port)
+            any_changed = any_changed or changed
+
+        if pending:
+            service_names = [self._get_service_name(p) for p in pending]
+            if any_changed:
+                self._systemctl("daemon-reload")
+            self._systemctl("enable", "--now", *service_names)
+
+            # One systemctl call verifies every new unit; config.batch()
+            # collapses the per-port YAML saves into one write
+            states = self._bulk_unit_state(pending)
+            failed = []
+            with self.config.batch():
+                for port in pending:
+                    if states.get(port, {}).get("ActiveState") == "active":
+                        self.config.add_port(port)
+                        results.append(f"Port {port}: forward started (socat)")
+                    else:
+                        self._systemctl("disable", self._get_service_name(port))
+                        self._remove_service_file(port)
+                        results.append(f"Port {port}: service failed to start")
+                        failed.append(port)
+            if failed:
+                self._systemctl("daemon-reload")
+
         return True, "\n".join(results)
 
-    def remove_multiple_forwards(self, ports_str: str) -> Tuple[bool, str]:
-        """Remove multiple forwards."""
-        ports = []
-        try:
-             for part in ports_str.split(','):
-                part = part.strip()
-                if '-' in part:
-                    start, end = map(int, part.split('-'))
-                    ports.extend(range(start, end + 1))
-                else:
-                    ports.append(int(part))
-        except ValueError:
-            return False, "Invalid port format"
-            
+    def remove_forwards(self, ports: List[int]) -> Tuple[bool, str]:
+        """Remove forwards for many ports with batched systemctl calls."""
+        if not self.config:
+            return False, "No tunnel configuration provided"
+
         results = []
+        pending = [p for p in ports if p in self.config.forwarded_ports]
         for port in ports:
-            if port in self.config.forwarded_ports:
-                success, msg = self.remove_forward(port)
-                results.append(msg)
-                
+            if port not in pending:
+                results.append(f"Port {port}: not in forwarded list")
+
+        if pending:
+            service_names = [self._get_service_name(p) for p in pending]
+            self._systemctl("stop", *service_names)
+            self._systemctl("disable", *service_names)
+
+            # Mirror create_forwards: verify the batched stop with one
+            # systemctl call. A unit that refused to stop keeps its port
+            # in config so the listener is not silently orphaned
+            states = self._bulk_unit_state(pending)
+            with self.config.batch():
+                for port in pending:
+                    if states.get(port, {}).get("ActiveState") == "active":
+                        results.append(f"Port {port}: service failed to stop, keeping forward")
+                        continue
+                    self._remove_service_file(port)
+                    self.config.remove_port(port)
+                    results.append(f"Port {port}: forward removed")
+            self._systemctl("daemon-reload")
+
         return True, "\n".join(results)
 
+    def add_multiple_forwards(self, ports_str: str) -> Tuple[bool, str]:
+        """Add multiple forwards."""
+        ports, parse_errors = parse_ports(ports_str)
+        if not ports:
+            return False, "Invalid port format"
+
+        success, msg = self.create_forwards(ports)
+        if parse_errors:
+            msg = "\n".join(parse_errors + ([msg] if msg else []))
+        return success, msg
+
+    def remove_multiple_forwards(self, ports_str: str) -> Tuple[bool, str]:
+        """Remove multiple forwards."""
+        ports, parse_errors = parse_ports(ports_str)
+        if not ports:
+            return False, "Invalid port format"
+
+        success, msg = self.remove_forwards(ports)
+        if parse_errors:
+            msg = "\n".join(parse_errors + ([msg] if msg else []))
+        return success, msg
+
     def list_forwards(self) -> List[Dict]:
         """List all configured port forwards (Interface Compatibility)."""
         forwards = []
-        
+
         # Use ConfigManager if self.config is not set, or just use self.config
         cm = ConfigManager()
         tunnels = cm.get_all_tunnels()
-        
+
+        # Resolve unit state for every port in one systemctl invocation
+        all_ports = []
+        for tunnel in tunnels:
+            if getattr(tunnel, 'remote_forward_ip', None):
+                all_ports.extend(tunnel.forwarded_ports)
+        unit_states = self._bulk_unit_state(all_ports)
+
         for tunnel in tunnels:
             remote_ip = getattr(tunnel, 'remote_forward_ip', None)
             if not remote_ip:
                 continue
-            
+
             for port in tunnel.forwarded_ports:
-                active = self._is_port_listening(port)
-                proc = self._get_port_process(port) if active else None
-                
-                # Check directly if socat is the process
-                is_socat = False
-                if proc and "socat" in proc:
-                    is_socat = True
-                
-                status_str = "Active (Socat)" if is_socat and active else ("Active (Other)" if active else "Stopped")
-                
+                if unit_states.get(port, {}).get("ActiveState") == "active":
+                    # Our systemd unit owns the port
+                    active = True
+                    proc = None
+                    status_str = "Active (Socat)"
+                else:
+                    # Fall back to port probing only when the unit isn't running
+                    active = self._is_port_listening(port)
+                    proc = self._get_port_process(port) if active else None
+                    status_str = "Active (Other)" if active else "Stopped"
+
                 forwards.append({
                     "port": port,
                     "tunnel": tunnel.name,
@@ -316,24 +536,70 @@ WantedBy=multi-user.target
         return True, "Socat config valid (managed per process)"
         
     async def start_all_forwards(self) -> Tuple[bool, str]:
-        """Start all configured forwards (Async for compatibility)."""
+        """Start all configured forwards (Async for compatibility).
+
+        Like create_forwards, this batches the systemd work: service files
+        are written per port, then one daemon-reload and one
+        'systemctl enable --now' cover every unit instead of a full
+        reload/enable/start cycle per port.
+        """
+        import time
+
         cm = ConfigManager()
         tunnels = cm.get_all_tunnels()
         count = 0
         errors = []
-        
+
+        targets = []  # (port, remote_ip)
         for tunnel in tunnels:
             remote_ip = getattr(tunnel, 'remote_forward_ip', None)
             if not remote_ip:
                 continue
-                
             for port in tunnel.forwarded_ports:
-                success, msg = self.start_forward(port, remote_ip, port)
-                if success:
+                targets.append((port, remote_ip))
+
+        if not targets:
+            return True, "Started 0 socat forwards"
+
+        if not self.check_socat_installed():
+            return False, "socat is not installed. Install with: apt-get install socat"
+
+        unit_states = self._bulk_unit_state([p for p, _ in targets])
+
+        pending = []
+        any_changed = False
+        for port, remote_ip in targets:
+            if unit_states.get(port, {}).get("ActiveState") == "active":
+                # Unit is already running; nothing to do for this port
+                count += 1
+                continue
+            if self._is_port_listening(port):
+                proc = self._get_port_process(port)
+                errors.append(f"{port}: Port already in use by: {proc or 'unknown process'}")
+                continue
+            success, changed, msg = self._create_service_file(port, remote_ip, port)
+            if not success:
+                errors.append(f"{port}: {msg}")
+                continue
+            any_changed = any_changed or changed
+            pending.append(port)
+
+        if pending:
+            if any_changed:
+                self._systemctl("daemon-reload")
+            service_names = [self._get_service_name(p) for p in pending]
+            self._systemctl("enable", "--now", *service_names)
+
+            time.sleep(0.5)
+            started_states = self._bulk_unit_state(pending)
+            for port in pending:
+                if started_states.get(port, {}).get("ActiveState") == "active":
                     count += 1
                 else:
-                    errors.append(f"{port}: {msg}")
-        
+                    errors.append(f"{port}: Failed to start service")
+                    self._systemctl("disable", self._get_service_name(port))
+                    self._remove_service_file(port)
+
         if errors:
             return False, f"Started {count} forwards, but errors occurred:\n" + "\n".join(errors)
         return True, f"Started {count} socat forwards"
@@ -364,28 +630,32 @@ WantedBy=multi-user.target
         import os
         
         stopped_count = 0
-        
+
         # 1. Stop all vortexl2-socat-* systemd services
         # List all service files
         service_pattern = "/etc/systemd/system/vortexl2-socat-*.service"
         service_files = glob.glob(service_pattern)
-        
-        for service_file in service_files:
-            service_name = os.path.basename(service_file).replace('.service', '')
-            run_command(f"systemctl stop {service_name}")
-            run_command(f"systemctl disable {service_name}")
-            try:
-                os.remove(service_file)
-                stopped_count += 1
-            except Exception:
-                pass
-        
+
         if service_files:
-            run_command("systemctl daemon-reload")
+            # systemctl accepts multiple units; stop/disable them all in one call each
+            service_names = [
+                os.path.basename(f).replace('.service', '') for f in service_files
+            ]
+            self._systemctl("stop", *service_names)
+            self._systemctl("disable", *service_names)
+
+            for service_file in service_files:
+                try:
+                    os.remove(service_file)
+                    stopped_count += 1
+                except Exception:
+                    pass
+
+            self._systemctl("daemon-reload")
         
         # 2. Kill any stray socat processes (fallback)
         cmd = "pkill -f 'socat.*TCP-LISTEN'"
-        run_command(cmd)
+        run_command(cmd, capture=False)
         
         # 3. Wait for them to exit
         time.sleep(0.5)
@@ -394,7 +664,7 @@ WantedBy=multi-user.target
         if running_pids:
             # Force kill remaining
             pids_str = " ".join(running_pids)
-            run_command(f"kill -9 {pids_str}")
+            run_command(f"kill -9 {pids_str}", capture=False)
             time.sleep(0.3)
             
             final_pids = self._get_running_socat_pids()
@@ -5,6 +5,7 @@ Handles L2TPv3 tunnel and session creation/deletion using iproute2.
 """
 
 from asyncio.log import logger
+import os
 import subprocess
 import re
 from typing import Optional, Dict, Tuple, List
@@ -52,6 +53,42 @@ def run_command(cmd: str, check: bool = False) -> CommandResult:
         )
 
 
+def run_apt_install(*packages: str, timeout: int = 120) -> CommandResult:
+    """Install packages with apt-get directly via argv, non-interactively.
+
+    Skips the shell fork, sets DEBIAN_FRONTEND=noninteractive so apt-get
+    can never stall on a prompt, and uses -qq to suppress progress output.
+    """
+    try:
+        result = subprocess.run(
+            ["apt-get", "-qq", "-y", "install", *packages],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            env={**os.environ, "DEBIAN_FRONTEND": "noninteractive"}
+        )
+        return CommandResult(
+            success=(result.returncode == 0),
+            stdout=result.stdout.strip(),
+            stderr=result.stderr.strip(),
+            returncode=result.returncode
+        )
+    except subprocess.TimeoutExpired:
+        return CommandResult(
+            success=False,
+            stdout="",
+            stderr="Command timed out",
+            returncode=-1
+        )
+    except Exception as e:
+        return CommandResult(
+            success=False,
+            stdout="",
+            stderr=str(e),
+            returncode=-1
+        )
+
+
 class TunnelManager:
     """Manages L2TPv3 tunnel and session operations for a specific tunnel config."""
     
@@ -81,17 +118,14 @@ class TunnelManager:
         
         # Install linux-modules-extra
         steps.append(f"Installing linux-modules-extra-{kernel_version}...")
-        result = run_command(f"apt-get install -y linux-modules-extra-{kernel_version}")
+        result = run_apt_install(f"linux-modules-extra-{kernel_version}")
         if not result.success:
-            # Try without specific version as fallback
-            result = run_command("apt-get install -y linux-modules-extra-$(uname -r)")
-            if not result.success:
-                steps.append(f"Warning: Could not install modules package: {result.stderr}")
+            steps.append(f"Warning: Could not install modules package: {result.stderr}")
         else:
             steps.append("Package installed successfully")
-        
+
         # Install iproute2 with l2tp support
-        result = run_command("apt-get install -y iproute2")
+        result = run_apt_install("iproute2")
         if not result.success:
             steps.append(f"Warning: Could not install iproute2: {result.stderr}")
         
@@ -291,10 +325,12 @@ class TunnelManager:
         
         port = self.config.udp_port
         
-        # Add iptables rules
+        # Add iptables rules; -w waits for the xtables lock so concurrent
+        # tunnel setups (cmd_apply runs them on a thread pool) don't fail
+        # when another invocation holds it
         commands = [
-            f"iptables -I INPUT -p udp --dport {port} -j ACCEPT",
-            f"iptables -I OUTPUT -p udp --sport {port} -j ACCEPT",
+            f"iptables -w -I INPUT -p udp --dport {port} -j ACCEPT",
+            f"iptables -w -I OUTPUT -p udp --sport {port} -j ACCEPT",
         ]
         
         for cmd in commands:
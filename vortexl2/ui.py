@@ -7,11 +7,13 @@ Rich-based TUI with ASCII banner and menu system.
 import os
 import sys
 import re
+import string
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List
 
 try:
-    from rich.console import Console
+    from rich.console import Console, Group
     from rich.panel import Panel
     from rich.table import Table
     from rich.text import Text
@@ -142,30 +144,63 @@ ASCII_BANNER = r"""
 
 def clear_screen():
     """Clear terminal screen."""
-    os.system('clear' if os.name != 'nt' else 'cls')
+    if os.name == 'nt':
+        os.system('cls')
+    else:
+        # Write the ANSI clear sequence directly instead of forking
+        # sh + clear on every menu redraw
+        sys.stdout.write("\x1b[H\x1b[2J")
+        sys.stdout.flush()
 
 
-def show_banner():
-    """Display the ASCII banner with developer info."""
-    clear_screen()
-    
-    banner_text = Text(ASCII_BANNER, style="bold cyan")
-    
-    # Print banner
-    console.print(banner_text)
-    
-    # Developer info bar
-    console.print(Panel(
-        f"[bold white]Telegram:[/] [cyan]@iliyadevsh[/]  |  [bold white]Version:[/] [red]{__version__}[/]  |  [bold white]GitHub:[/] [cyan]github.com/iliya-Developer[/]",
-        title="[bold white]VortexL2 - L2TPv3 Tunnel Manager[/]",
-        border_style="cyan",
-        box=box.ROUNDED
-    ))
-    console.print()
+# Tunnel names allow lowercase alphanumerics and dashes; everything else
+# maps to "-" via one precomputed str.translate table
+_NAME_ALLOWED = set(string.ascii_lowercase + string.digits + "-")
+_NAME_TABLE = {i: "-" for i in range(128) if chr(i) not in _NAME_ALLOWED}
 
+# Immutable banner pieces: parse the markup and build the panels once at
+# import instead of on every keypress-driven redraw
+_BANNER_TEXT = Text(ASCII_BANNER, style="bold cyan")
+_CONTACT_PANEL = Panel(
+    f"[bold white]Telegram:[/] [cyan]@iliyadevsh[/]  |  [bold white]Version:[/] [red]{__version__}[/]  |  [bold white]GitHub:[/] [cyan]github.com/iliya-Developer[/]",
+    title="[bold white]VortexL2 - L2TPv3 Tunnel Manager[/]",
+    border_style="cyan",
+    box=box.ROUNDED
+)
 
-def show_main_menu() -> str:
-    """Display main menu and get user choice."""
+
+# Banner + developer info bar + trailing blank line as one renderable,
+# so each frame is a single layout pass and stdout write
+_BANNER_GROUP = Group(_BANNER_TEXT, _CONTACT_PANEL, "")
+
+# Rendered clear-sequence + banner ANSI, captured lazily and keyed by the
+# terminal width so a resized window triggers a fresh layout
+_BANNER_FRAME = None
+_BANNER_FRAME_WIDTH = None
+
+
+def show_banner():
+    """Display the ASCII banner with developer info."""
+    global _BANNER_FRAME, _BANNER_FRAME_WIDTH
+    if os.name == 'nt':
+        clear_screen()
+        console.print(_BANNER_GROUP)
+        return
+    if _BANNER_FRAME is None or _BANNER_FRAME_WIDTH != console.width:
+        # The banner never changes at a given width, so render it through
+        # rich once and replay the bytes on every redraw. Prepending the
+        # clear sequence makes each frame a single stdout write, which
+        # keeps keypress redraws from flickering on slow terminals
+        with console.capture() as capture:
+            console.print(_BANNER_GROUP)
+        _BANNER_FRAME = "\x1b[H\x1b[2J" + capture.get()
+        _BANNER_FRAME_WIDTH = console.width
+    sys.stdout.write(_BANNER_FRAME)
+    sys.stdout.flush()
+
+
+def _build_main_menu_panel() -> Panel:
+    """Build the static main menu panel (done once at import)."""
     menu_items = [
         ("1", "Install/Verify Prerequisites"),
         ("2", "Create Tunnel"),
@@ -175,26 +210,52 @@ def show_main_menu() -> str:
         ("6", "View Logs"),
         ("0", "Exit"),
     ]
-    
+
     table = Table(show_header=False, box=box.SIMPLE, padding=(0, 2))
     table.add_column("Option", style="bold cyan", width=4)
     table.add_column("Description", style="white")
-    
+
     for opt, desc in menu_items:
         table.add_row(f"[{opt}]", desc)
-    
-    console.print(Panel(table, title="[bold white]Main Menu[/]", border_style="blue"))
-    
+
+    return Panel(table, title="[bold white]Main Menu[/]", border_style="blue")
+
+
+_MAIN_MENU_PANEL = _build_main_menu_panel()
+
+
+def show_main_menu() -> str:
+    """Display main menu and get user choice."""
+    console.print(_MAIN_MENU_PANEL)
+
     return Prompt.ask("\n[bold cyan]Select option[/]", default="0")
 
 
+# Forwards/mode menus only vary by the current mode, so memoize one
+# panel per mode instead of rebuilding the table each display
+_FORWARDS_MENU_PANELS = {}
+_FORWARD_MODE_MENU_PANELS = {}
+
+
 def show_forwards_menu(forward_mode: str = "none") -> str:
     """Display forwards submenu."""
+    panel = _FORWARDS_MENU_PANELS.get(forward_mode)
+    if panel is None:
+        panel = _build_forwards_menu_panel(forward_mode)
+        _FORWARDS_MENU_PANELS[forward_mode] = panel
+
+    console.print(panel)
+
+    return Prompt.ask("\n[bold cyan]Select option[/]", default="0")
+
+
+def _build_forwards_menu_panel(forward_mode: str) -> Panel:
+    """Build the forwards submenu panel for a given mode."""
     # Mode indicator
     mode_colors = {"none": "dim", "haproxy": "green", "socat": "yellow"}
     mode_color = mode_colors.get(forward_mode, "dim")
     mode_label = f"[{mode_color}]{forward_mode.upper()}[/]"
-    
+
     menu_items = [
         ("1", "Add Port Forwards"),
         ("2", "Remove Port Forwards"),
@@ -212,14 +273,24 @@ def show_forwards_menu(forward_mode: str = "none") -> str:
     
     for opt, desc in menu_items:
         table.add_row(f"[{opt}]", desc)
-    
-    console.print(Panel(table, title="[bold white]Port Forwards[/]", border_style="green"))
-    
-    return Prompt.ask("\n[bold cyan]Select option[/]", default="0")
+
+    return Panel(table, title="[bold white]Port Forwards[/]", border_style="green")
 
 
 def show_forward_mode_menu(current_mode: str) -> str:
     """Display forward mode selection menu."""
+    panel = _FORWARD_MODE_MENU_PANELS.get(current_mode)
+    if panel is None:
+        panel = _build_forward_mode_menu_panel(current_mode)
+        _FORWARD_MODE_MENU_PANELS[current_mode] = panel
+
+    console.print(panel)
+
+    return Prompt.ask("\n[bold cyan]Select mode[/]", default="0")
+
+
+def _build_forward_mode_menu_panel(current_mode: str) -> Panel:
+    """Build the forward-mode selection panel for a given mode."""
     modes = [
         ("1", "none", "Disabled - Port forwarding off"),
         ("2", "haproxy", "HAProxy - High performance port forwarding"),
@@ -235,18 +306,21 @@ def show_forward_mode_menu(current_mode: str) -> str:
     for opt, mode, desc in modes:
         current = " [green]✓[/]" if mode == current_mode else ""
         table.add_row(f"[{opt}]", mode + current, desc)
-    
-    console.print(Panel(table, title="[bold white]Select Forward Mode[/]", border_style="yellow"))
-    
-    return Prompt.ask("\n[bold cyan]Select mode[/]", default="0")
 
+    return Panel(table, title="[bold white]Select Forward Mode[/]", border_style="yellow")
+
+
+def show_tunnel_list(manager: ConfigManager, tunnels: Optional[List[TunnelConfig]] = None):
+    """Display list of all configured tunnels with status.
 
-def show_tunnel_list(manager: ConfigManager):
-    """Display list of all configured tunnels with status."""
+    Callers that already fetched the tunnel list can pass it in to avoid
+    a redundant config read.
+    """
     from .tunnel import TunnelManager
-    
-    tunnels = manager.get_all_tunnels()
-    
+
+    if tunnels is None:
+        tunnels = manager.get_all_tunnels()
+
     if not tunnels:
         console.print("[yellow]No tunnels configured.[/]")
         return
@@ -260,11 +334,16 @@ def show_tunnel_list(manager: ConfigManager):
     table.add_column("Tunnel ID", style="white")
     table.add_column("Status", style="white")
     
-    for i, config in enumerate(tunnels, 1):
-        tunnel_mgr = TunnelManager(config)
-        is_running = tunnel_mgr.check_tunnel_exists()
+    # Each existence check forks an ip subprocess; probe the tunnels in
+    # parallel so the render waits for the slowest probe, not the sum
+    with ThreadPoolExecutor(max_workers=min(8, len(tunnels))) as executor:
+        running = list(executor.map(
+            lambda config: TunnelManager(config).check_tunnel_exists(), tunnels
+        ))
+
+    for i, (config, is_running) in enumerate(zip(tunnels, running), 1):
         status = "[green]Running[/]" if is_running else "[red]Stopped[/]"
-        
+
         table.add_row(
             str(i),
             config.name,
@@ -283,8 +362,11 @@ def prompt_tunnel_name() -> Optional[str]:
     console.print("\n[dim]Enter a unique name for the tunnel (alphanumeric and dashes only)[/]")
     name = Prompt.ask("[bold magenta]Tunnel Name[/]", default="tunnel1")
     
-    # Sanitize name
-    name = "".join(c if c.isalnum() or c == "-" else "-" for c in name.lower())
+    # Sanitize name: one C-level translate pass instead of a per-character loop
+    name = name.lower()
+    if not name.isascii():
+        name = name.encode("ascii", "replace").decode()
+    name = name.translate(_NAME_TABLE)
     return name if name else None
 
 
@@ -296,11 +378,12 @@ def prompt_select_tunnel(manager: ConfigManager) -> Optional[str]:
         console.print("[yellow]No tunnels available.[/]")
         return None
     
-    console.print("\n[bold white]Available Tunnels:[/]")
-    for i, name in enumerate(tunnels, 1):
-        console.print(f"  [bold cyan][{i}][/] {name}")
-    console.print(f"  [bold cyan][0][/] Cancel")
-    
+    # One print per list instead of one per entry
+    lines = ["\n[bold white]Available Tunnels:[/]"]
+    lines += [f"  [bold cyan][{i}][/] {name}" for i, name in enumerate(tunnels, 1)]
+    lines.append("  [bold cyan][0][/] Cancel")
+    console.print("\n".join(lines))
+
     choice = Prompt.ask("\n[bold cyan]Select tunnel[/]", default="0")
     
     try:
@@ -534,11 +617,12 @@ def prompt_select_tunnel_for_forwards(manager: ConfigManager) -> Optional[Tunnel
     if len(tunnels) == 1:
         return tunnels[0]
     
-    console.print("\n[bold white]Select tunnel for port forwards:[/]")
-    for i, tunnel in enumerate(tunnels, 1):
-        console.print(f"  [bold cyan][{i}][/] {tunnel.name}")
-    console.print(f"  [bold cyan][0][/] Cancel")
-    
+    # One print per list instead of one per entry
+    lines = ["\n[bold white]Select tunnel for port forwards:[/]"]
+    lines += [f"  [bold cyan][{i}][/] {tunnel.name}" for i, tunnel in enumerate(tunnels, 1)]
+    lines.append("  [bold cyan][0][/] Cancel")
+    console.print("\n".join(lines))
+
     choice = Prompt.ask("\n[bold cyan]Select tunnel[/]", default="1")
     
     try: